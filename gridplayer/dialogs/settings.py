@@ -1,8 +1,10 @@
 import contextlib
 import logging
 import subprocess
+from functools import partial
+from types import MappingProxyType
 
-from PyQt5.QtCore import QUrl
+from PyQt5.QtCore import QT_TRANSLATE_NOOP, QTimer, QUrl
 from PyQt5.QtGui import QDesktopServices, QIcon, QPalette
 from PyQt5.QtWidgets import QCheckBox, QComboBox, QDialog, QLineEdit, QSpinBox
 
@@ -23,7 +25,7 @@ from gridplayer.params.static import (
 from gridplayer.settings import Settings
 from gridplayer.utils import log_config
 from gridplayer.utils.app_dir import get_app_data_dir
-from gridplayer.utils.qt import qt_connect, translate
+from gridplayer.utils.qt import translate
 from gridplayer.widgets.language_list import LanguageList
 from gridplayer.widgets.resolver_patterns_list import ResolverPatternsList
 
@@ -34,17 +36,134 @@ VIDEO_DRIVERS_MULTIPROCESS = (
 
 MAX_VLC_PROCESSES = 64
 
+LOG_LEVELS_VLC = (
+    (log_config.DISABLED, QT_TRANSLATE_NOOP("ErrorLevel", "None")),
+    (logging.ERROR, QT_TRANSLATE_NOOP("ErrorLevel", "Error")),
+    (logging.WARNING, QT_TRANSLATE_NOOP("ErrorLevel", "Warning")),
+    (logging.INFO, QT_TRANSLATE_NOOP("ErrorLevel", "Info")),
+    (logging.DEBUG, QT_TRANSLATE_NOOP("ErrorLevel", "Debug")),
+)
+
+LOG_LEVELS = (
+    (log_config.DISABLED, QT_TRANSLATE_NOOP("ErrorLevel", "None")),
+    (logging.CRITICAL, QT_TRANSLATE_NOOP("ErrorLevel", "Critical")),
+    (logging.ERROR, QT_TRANSLATE_NOOP("ErrorLevel", "Error")),
+    (logging.WARNING, QT_TRANSLATE_NOOP("ErrorLevel", "Warning")),
+    (logging.INFO, QT_TRANSLATE_NOOP("ErrorLevel", "Info")),
+    (logging.DEBUG, QT_TRANSLATE_NOOP("ErrorLevel", "Debug")),
+)
+
+ASPECT_RATIOS = (
+    (VideoAspect.FIT, QT_TRANSLATE_NOOP("SettingsDialog", "Fit")),
+    (VideoAspect.STRETCH, QT_TRANSLATE_NOOP("SettingsDialog", "Stretch")),
+    (VideoAspect.NONE, QT_TRANSLATE_NOOP("SettingsDialog", "None")),
+)
+
+TRANSFORM_OPTIONS = (
+    (VideoTransform.ROTATE_90, QT_TRANSLATE_NOOP("SettingsDialog", "Rotate 90")),
+    (VideoTransform.ROTATE_180, QT_TRANSLATE_NOOP("SettingsDialog", "Rotate 180")),
+    (VideoTransform.ROTATE_270, QT_TRANSLATE_NOOP("SettingsDialog", "Rotate 270")),
+    (VideoTransform.HFLIP, QT_TRANSLATE_NOOP("SettingsDialog", "Flip Horizontally")),
+    (VideoTransform.VFLIP, QT_TRANSLATE_NOOP("SettingsDialog", "Flip Vertically")),
+    (VideoTransform.TRANSPOSE, QT_TRANSLATE_NOOP("SettingsDialog", "Transpose")),
+    (
+        VideoTransform.ANTITRANSPOSE,
+        QT_TRANSLATE_NOOP("SettingsDialog", "Anti-transpose"),
+    ),
+    (VideoTransform.NONE, QT_TRANSLATE_NOOP("SettingsDialog", "No Transform")),
+)
+
+REPEAT_MODES = (
+    (VideoRepeat.SINGLE_FILE, QT_TRANSLATE_NOOP("SettingsDialog", "Single File")),
+    (VideoRepeat.DIR, QT_TRANSLATE_NOOP("SettingsDialog", "Directory")),
+    (
+        VideoRepeat.DIR_SHUFFLE,
+        QT_TRANSLATE_NOOP("SettingsDialog", "Directory (Shuffle)"),
+    ),
+)
+
+GRID_MODES = (
+    (GridMode.AUTO_ROWS, QT_TRANSLATE_NOOP("SettingsDialog", "Rows First")),
+    (GridMode.AUTO_COLS, QT_TRANSLATE_NOOP("SettingsDialog", "Columns First")),
+)
+
+STREAM_QUALITY_CODES = (
+    ("best", QT_TRANSLATE_NOOP("SettingsDialog", "Best")),
+    ("worst", QT_TRANSLATE_NOOP("SettingsDialog", "Worst")),
+    ("best_audio_only", QT_TRANSLATE_NOOP("SettingsDialog", "Best (Audio Only)")),
+    ("worst_audio_only", QT_TRANSLATE_NOOP("SettingsDialog", "Worst (Audio Only)")),
+)
+
+STREAM_QUALITY_CODES_STANDARD = (
+    "2160p",
+    "2160p60",
+    "1440p",
+    "1440p60",
+    "1080p",
+    "1080p60",
+    "720p60",
+    "720p",
+    "480p",
+    "360p",
+    "240p",
+    "144p",
+)
+
+SEEK_SYNC_MODES = (
+    (SeekSyncMode.DISABLED, QT_TRANSLATE_NOOP("SettingsDialog", "Disabled")),
+    (SeekSyncMode.PERCENT, QT_TRANSLATE_NOOP("SettingsDialog", "Percent")),
+    (SeekSyncMode.TIMECODE, QT_TRANSLATE_NOOP("SettingsDialog", "Timecode")),
+)
+
+AUDIO_MODES = (
+    (AudioChannelMode.UNSET, QT_TRANSLATE_NOOP("Audio Mode", "Original")),
+    (AudioChannelMode.STEREO, QT_TRANSLATE_NOOP("Audio Mode", "Stereo")),
+    (AudioChannelMode.RSTEREO, QT_TRANSLATE_NOOP("Audio Mode", "Reverse Stereo")),
+    (AudioChannelMode.LEFT, QT_TRANSLATE_NOOP("Audio Mode", "Left")),
+    (AudioChannelMode.RIGHT, QT_TRANSLATE_NOOP("Audio Mode", "Right")),
+    (AudioChannelMode.DOLBYS, QT_TRANSLATE_NOOP("Audio Mode", "Dolby Surround")),
+    (AudioChannelMode.HEADPHONES, QT_TRANSLATE_NOOP("Audio Mode", "Headphones")),
+    (AudioChannelMode.MONO, QT_TRANSLATE_NOOP("Audio Mode", "Mono")),
+)
+
 
 def _fill_combo_box(combo_box, values_dict):
     for i_id, i_name in values_dict.items():
         combo_box.addItem(i_name, i_id)
 
 
+def _fill_combo_box_translated(combo_box, context, values):
+    for i_id, i_name in values:
+        combo_box.addItem(translate(context, i_name), i_id)
+
+
+def _index_combo_box(combo_box):
+    # first item wins on duplicates, same as findData
+    combo_box.data_index = {
+        combo_box.itemData(idx): idx for idx in reversed(range(combo_box.count()))
+    }
+
+
 def _set_combo_box(combo_box, data_value):
-    idx = combo_box.findData(data_value)
+    idx = combo_box.data_index.get(data_value, -1)
     combo_box.setCurrentIndex(idx)
 
 
+ELEMENTS_IO = MappingProxyType(
+    {
+        QCheckBox: (QCheckBox.isChecked, QCheckBox.setChecked),
+        QSpinBox: (QSpinBox.value, QSpinBox.setValue),
+        QLineEdit: (QLineEdit.text, QLineEdit.setText),
+        QComboBox: (QComboBox.currentData, _set_combo_box),
+        LanguageList: (LanguageList.value, LanguageList.setValue),
+        ResolverPatternsList: (
+            ResolverPatternsList.rows_data,
+            ResolverPatternsList.setDataRows,
+        ),
+    }
+)
+
+
 def _set_groupbox_header_bold(groupbox):
     font = groupbox.font()
     font.setBold(True)
@@ -63,6 +182,15 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
 
         self._log = logging.getLogger(self.__class__.__name__)
 
+        self._initialized = False
+
+    def showEvent(self, event):
+        if not self._initialized:
+            self.ui_init()
+
+        super().showEvent(event)
+
+    def ui_init(self):
         self.setupUi(self)
 
         self.settings_map = {
@@ -115,6 +243,8 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
             "streaming/resolver_priority_patterns": self.streamingResolverPriorityPatterns,  # noqa: E501
         }
 
+        self.settings_io = self._bind_settings_io()
+
         self.ui_customize()
         self.ui_fill()
 
@@ -125,13 +255,18 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
 
         self.ui_customize_dynamic()
 
+        self._initialized = True
+
     def ui_customize(self):  # noqa: WPS213
         for btn in self.buttonBox.buttons():
             btn.setIcon(QIcon())
 
         self.ui_customize_section_index()
 
-        _set_groupbox_header_bold(self.playerVideoDriverBox)
+        # Visual only, no need to hold the dialog from showing up
+        QTimer.singleShot(
+            0, partial(_set_groupbox_header_bold, self.playerVideoDriverBox)
+        )
 
         if env.IS_LINUX:
             self.playerStayOnTop.hide()
@@ -165,6 +300,10 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
         self.fill_streamingResolverPriority()
         self.fill_videoAudioMode()
 
+        for element in self.settings_map.values():
+            if isinstance(element, QComboBox):
+                _index_combo_box(element)
+
     def ui_set_limits(self):  # noqa: WPS213
         self.playerVideoDriverPlayers.setRange(1, MAX_VLC_PROCESSES)
         self.timeoutOverlay.setRange(1, 60)
@@ -193,19 +332,17 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
 
         self.switch_page(None)
 
-    def ui_connect(self):
-        qt_connect(
-            (self.playerVideoDriver.currentIndexChanged, self.driver_selected),
-            (self.timeoutMouseHideFlag.stateChanged, self.timeoutMouseHide.setEnabled),
-            (self.timeoutOverlayFlag.stateChanged, self.timeoutOverlay.setEnabled),
-            (self.logFileOpen.clicked, self.open_logfile),
-            (self.section_index.currentTextChanged, self.switch_page),
-            (self.section_index.itemSelectionChanged, self.keep_index_selection),
-            (self.logLimit.stateChanged, self.logLimitSize.setEnabled),
-            (self.logLimit.stateChanged, self.logLimitBackups.setEnabled),
-            (self.streamingWildcardHelpButton.clicked, self.toggle_wildcard_help),
-            (self.playerRecentList.stateChanged, self.playerRecentListSize.setEnabled),
-        )
+    def ui_connect(self):  # noqa: WPS213
+        self.playerVideoDriver.currentIndexChanged.connect(self.driver_selected)
+        self.timeoutMouseHideFlag.stateChanged.connect(self.timeoutMouseHide.setEnabled)
+        self.timeoutOverlayFlag.stateChanged.connect(self.timeoutOverlay.setEnabled)
+        self.logFileOpen.clicked.connect(self.open_logfile)
+        self.section_index.currentTextChanged.connect(self.switch_page)
+        self.section_index.itemSelectionChanged.connect(self.keep_index_selection)
+        self.logLimit.stateChanged.connect(self.logLimitSize.setEnabled)
+        self.logLimit.stateChanged.connect(self.logLimitBackups.setEnabled)
+        self.streamingWildcardHelpButton.clicked.connect(self.toggle_wildcard_help)
+        self.playerRecentList.stateChanged.connect(self.playerRecentListSize.setEnabled)
 
     def toggle_wildcard_help(self):
         self.streamingWildcardHelp.setVisible(
@@ -257,67 +394,24 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_path)))
 
     def fill_logLevelVLC(self):
-        log_levels = {
-            log_config.DISABLED: translate("ErrorLevel", "None"),
-            logging.ERROR: translate("ErrorLevel", "Error"),
-            logging.WARNING: translate("ErrorLevel", "Warning"),
-            logging.INFO: translate("ErrorLevel", "Info"),
-            logging.DEBUG: translate("ErrorLevel", "Debug"),
-        }
-
-        _fill_combo_box(self.logLevelVLC, log_levels)
+        _fill_combo_box_translated(self.logLevelVLC, "ErrorLevel", LOG_LEVELS_VLC)
 
     def fill_logLevel(self):
-        log_levels = {
-            log_config.DISABLED: translate("ErrorLevel", "None"),
-            logging.CRITICAL: translate("ErrorLevel", "Critical"),
-            logging.ERROR: translate("ErrorLevel", "Error"),
-            logging.WARNING: translate("ErrorLevel", "Warning"),
-            logging.INFO: translate("ErrorLevel", "Info"),
-            logging.DEBUG: translate("ErrorLevel", "Debug"),
-        }
-
-        _fill_combo_box(self.logLevel, log_levels)
+        _fill_combo_box_translated(self.logLevel, "ErrorLevel", LOG_LEVELS)
 
     def fill_videoAspect(self):
-        aspect_ratios = {
-            VideoAspect.FIT: self.tr("Fit"),
-            VideoAspect.STRETCH: self.tr("Stretch"),
-            VideoAspect.NONE: self.tr("None"),
-        }
-
-        _fill_combo_box(self.videoAspect, aspect_ratios)
+        _fill_combo_box_translated(self.videoAspect, "SettingsDialog", ASPECT_RATIOS)
 
     def fill_videoTransform(self):
-        transform_options = {
-            VideoTransform.ROTATE_90: self.tr("Rotate 90"),
-            VideoTransform.ROTATE_180: self.tr("Rotate 180"),
-            VideoTransform.ROTATE_270: self.tr("Rotate 270"),
-            VideoTransform.HFLIP: self.tr("Flip Horizontally"),
-            VideoTransform.VFLIP: self.tr("Flip Vertically"),
-            VideoTransform.TRANSPOSE: self.tr("Transpose"),
-            VideoTransform.ANTITRANSPOSE: self.tr("Anti-transpose"),
-            VideoTransform.NONE: self.tr("No Transform"),
-        }
-
-        _fill_combo_box(self.videoTransform, transform_options)
+        _fill_combo_box_translated(
+            self.videoTransform, "SettingsDialog", TRANSFORM_OPTIONS
+        )
 
     def fill_repeatMode(self):
-        repeat_modes = {
-            VideoRepeat.SINGLE_FILE: self.tr("Single File"),
-            VideoRepeat.DIR: self.tr("Directory"),
-            VideoRepeat.DIR_SHUFFLE: self.tr("Directory (Shuffle)"),
-        }
-
-        _fill_combo_box(self.repeatMode, repeat_modes)
+        _fill_combo_box_translated(self.repeatMode, "SettingsDialog", REPEAT_MODES)
 
     def fill_gridMode(self):
-        grid_modes = {
-            GridMode.AUTO_ROWS: self.tr("Rows First"),
-            GridMode.AUTO_COLS: self.tr("Columns First"),
-        }
-
-        _fill_combo_box(self.gridMode, grid_modes)
+        _fill_combo_box_translated(self.gridMode, "SettingsDialog", GRID_MODES)
 
     def fill_playerVideoDriver(self):
         if env.IS_MACOS:
@@ -351,41 +445,17 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
             self.listLanguages.add_language_row(language)
 
     def fill_streamQuality(self):
-        quality_codes = {
-            "best": self.tr("Best"),
-            "worst": self.tr("Worst"),
-            "best_audio_only": self.tr("Best (Audio Only)"),
-            "worst_audio_only": self.tr("Worst (Audio Only)"),
-        }
+        _fill_combo_box_translated(
+            self.streamQuality, "SettingsDialog", STREAM_QUALITY_CODES
+        )
 
-        standard_quality_codes = [
-            "2160p",
-            "2160p60",
-            "1440p",
-            "1440p60",
-            "1080p",
-            "1080p60",
-            "720p60",
-            "720p",
-            "480p",
-            "360p",
-            "240p",
-            "144p",
-        ]
-
-        for code in standard_quality_codes:
-            quality_codes[code] = code
-
-        _fill_combo_box(self.streamQuality, quality_codes)
+        for code in STREAM_QUALITY_CODES_STANDARD:
+            self.streamQuality.addItem(code, code)
 
     def fill_playlistSeekSyncMode(self):
-        seek_modes = {
-            SeekSyncMode.DISABLED: self.tr("Disabled"),
-            SeekSyncMode.PERCENT: self.tr("Percent"),
-            SeekSyncMode.TIMECODE: self.tr("Timecode"),
-        }
-
-        _fill_combo_box(self.playlistSeekSyncMode, seek_modes)
+        _fill_combo_box_translated(
+            self.playlistSeekSyncMode, "SettingsDialog", SEEK_SYNC_MODES
+        )
 
     def fill_streamingResolverPriority(self):
         resolvers = {
@@ -397,18 +467,7 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
         _fill_combo_box(self.streamingResolverPriority, resolvers)
 
     def fill_videoAudioMode(self):
-        modes = {
-            AudioChannelMode.UNSET: translate("Audio Mode", "Original"),
-            AudioChannelMode.STEREO: translate("Audio Mode", "Stereo"),
-            AudioChannelMode.RSTEREO: translate("Audio Mode", "Reverse Stereo"),
-            AudioChannelMode.LEFT: translate("Audio Mode", "Left"),
-            AudioChannelMode.RIGHT: translate("Audio Mode", "Right"),
-            AudioChannelMode.DOLBYS: translate("Audio Mode", "Dolby Surround"),
-            AudioChannelMode.HEADPHONES: translate("Audio Mode", "Headphones"),
-            AudioChannelMode.MONO: translate("Audio Mode", "Mono"),
-        }
-
-        _fill_combo_box(self.videoAudioMode, modes)
+        _fill_combo_box_translated(self.videoAudioMode, "Audio Mode", AUDIO_MODES)
 
     def driver_selected(self, idx):
         driver_id = self.playerVideoDriver.itemData(idx)
@@ -419,49 +478,44 @@ class SettingsDialog(QDialog, Ui_SettingsDialog):
             self.playerVideoDriverPlayers.setDisabled(True)
 
     def load_settings(self):
-        elements_value_set_fun = {
-            QCheckBox: lambda e, v: e.setChecked(v),
-            QSpinBox: lambda e, v: e.setValue(v),
-            QLineEdit: lambda e, v: e.setText(v),
-            QComboBox: _set_combo_box,
-            LanguageList: lambda e, v: e.setValue(v),
-            ResolverPatternsList: lambda e, v: e.setDataRows(v),
+        settings_values = Settings().get_many(self.settings_map)
+
+        for setting, _, _, set_function in self.settings_io:
+            set_function(settings_values[setting])
+
+    def save_settings(self):
+        if not self._initialized:
+            return
+
+        settings_values = {
+            setting: get_function()
+            for setting, element, get_function, _ in self.settings_io
+            if element.isEnabled()
         }
 
-        for setting, element in self.settings_map.items():
-            setting_value = Settings().get(setting)
+        Settings().set_many(settings_values)
 
-            try:
-                set_function = elements_value_set_fun[type(element)]
-            except KeyError:
-                raise ValueError(f"No element decoder for {setting}")
+    def accept(self):
+        self.save_settings()
 
-            set_function(element, setting_value)
+        super().accept()
 
-    def save_settings(self):
-        elements_value_read_attr = {
-            QCheckBox: "isChecked",
-            QSpinBox: "value",
-            QLineEdit: "text",
-            QComboBox: "currentData",
-            LanguageList: "value",
-            ResolverPatternsList: "rows_data",
-        }
+    def _bind_settings_io(self):
+        settings_io = []
 
         for setting, element in self.settings_map.items():
-            if not element.isEnabled():
-                continue
-
             try:
-                value_attr = elements_value_read_attr[type(element)]
+                get_function, set_function = ELEMENTS_IO[type(element)]
             except KeyError:
                 raise ValueError(f"No element decoder for {setting}")
 
-            new_value = getattr(element, value_attr)()
-
-            Settings().set(setting, new_value)
-
-    def accept(self):
-        self.save_settings()
+            settings_io.append(
+                (
+                    setting,
+                    element,
+                    partial(get_function, element),
+                    partial(set_function, element),
+                )
+            )
 
-        super().accept()
+        return settings_io
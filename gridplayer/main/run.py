@@ -1,4 +1,7 @@
 import sys
+from functools import partial
+
+from PyQt5.QtCore import QTimer
 
 from gridplayer.dialogs.messagebox import QCustomMessageBox
 from gridplayer.main.init_app import init_app
@@ -38,7 +41,8 @@ def run_app():
 
     app.installEventFilter(player)
 
+    # Queued after deferred managers initialization
     if sys.argv[1:]:
-        player.process_arguments(sys.argv[1:])
+        QTimer.singleShot(0, partial(player.process_arguments, sys.argv[1:]))
 
     return app.exec_()
@@ -63,15 +63,17 @@ class Playlist(BaseModel):
 
         playlist_config.append(
             "#P:{0}".format(
-                self.json(exclude_none=True, exclude=_excluded_fields_playlist())
+                self.json(exclude_none=True, exclude=excluded_fields_playlist())
             )
         )
 
+        video_exclude = excluded_fields_video()
+
         for idx, video in enumerate(self.videos):
             playlist_config.append(
                 "#V{0}:{1}".format(
                     idx,
-                    video.json(exclude_none=True, exclude=_excluded_fields_video()),
+                    video.json(exclude_none=True, exclude=video_exclude),
                 )
             )
             playlist_vids.append(str(video.uri))
@@ -120,8 +122,8 @@ def _parse_video_paths(playlist_in) -> List[str]:
     return [line for line in playlist_in if line and not line.startswith("#")]
 
 
-def _excluded_fields_playlist():
-    excluded_fields_playlist = {"videos"}
+def excluded_fields_playlist():
+    excluded_fields = {"videos"}
 
     exclude_list = [
         ("playlist/save_window", "window_state"),
@@ -129,13 +131,13 @@ def _excluded_fields_playlist():
 
     for setting, field in exclude_list:
         if not Settings().get(setting):
-            excluded_fields_playlist.add(field)
+            excluded_fields.add(field)
 
-    return excluded_fields_playlist
+    return excluded_fields
 
 
-def _excluded_fields_video():
-    excluded_fields_video = {"uri"}
+def excluded_fields_video():
+    excluded_fields = {"uri"}
 
     exclude_list = [
         ("playlist/save_position", "current_position"),
@@ -144,6 +146,6 @@ def _excluded_fields_video():
 
     for setting, field in exclude_list:
         if not Settings().get(setting):
-            excluded_fields_video.add(field)
+            excluded_fields.add(field)
 
-    return excluded_fields_video
+    return excluded_fields
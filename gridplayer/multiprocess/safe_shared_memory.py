@@ -19,9 +19,13 @@ class releasing(object):
 
 
 class SafeSharedMemory(object):
-    def __init__(self, name, lock):
+    def __init__(self, name, locks, frame_seq):
         self.name = name
-        self.lock = lock
+
+        # one lock per buffer, frame_seq counts published frames
+        # and points to the last complete buffer
+        self.locks = locks
+        self.frame_seq = frame_seq
 
         self._memory = None
 
@@ -43,11 +47,11 @@ class SafeSharedMemory(object):
 
         return self._memory
 
-    def allocate(self, size):
+    def allocate(self, buffer_size):
         self._is_allocator = True
 
-        self._buf_size = size
-        self._memory = SharedMemory(name=self.name, create=True, size=size)
+        self._buf_size = buffer_size * len(self.locks)
+        self._memory = SharedMemory(name=self.name, create=True, size=self._buf_size)
 
     @property
     def ptr(self):
@@ -61,10 +65,12 @@ class SafeSharedMemory(object):
         return self._ptr
 
     def __enter__(self):
-        return self.lock.acquire()
+        for lock in self.locks:
+            lock.acquire()
 
     def __exit__(self, *args):
-        return self.lock.release()
+        for lock in reversed(self.locks):
+            lock.release()
 
     def close(self):
         if self._memory is None:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, NamedTuple
 
 from PyQt5.QtCore import QLocale
@@ -23,17 +24,22 @@ class Language(NamedTuple):
 
     @property
     def title_native(self) -> str:
-        return QLocale(self.code).nativeLanguageName().title()
+        return _get_locale(self.code).nativeLanguageName().title()
 
     @property
     def country_native(self) -> str:
-        return QLocale(self.code).nativeCountryName().title()
+        return _get_locale(self.code).nativeCountryName().title()
 
     @property
     def icon_path(self):
         return f":/icons/flag_{self.code}.svg"
 
 
+@lru_cache(maxsize=None)
+def _get_locale(language_code: str) -> QLocale:
+    return QLocale(language_code)
+
+
 def get_system_language() -> str:
     local_language_code = QLocale().system().name()
 
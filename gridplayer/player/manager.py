@@ -1,4 +1,6 @@
-from PyQt5.QtCore import QObject
+import importlib
+
+from PyQt5.QtCore import QObject, QTimer
 
 from gridplayer.utils.command_helpers import AND, NOT, OR
 
@@ -59,6 +61,12 @@ class Context(object):
         return self._context[var_name]
 
 
+def _import_manager_cls(manager_path):
+    module_name, class_name = manager_path
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class ManagersManager(QObject):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -68,56 +76,94 @@ class ManagersManager(QObject):
         self._context.commands = Commands()
 
         self.managers = {}
+        self.managers_deferred = {}
         self.connections = {}
         self.event_filters = []
         self.global_event_filters = []
 
     def init(self):
-        self._init_managers_instances()
-        self._init_connections()
-        self._init_event_filters()
+        self._init_managers_batch(self.managers)
 
-        self._init_managers()
+        # Managers that are not needed to show the window
+        # are created once the event loop is running
+        if self.managers_deferred:
+            QTimer.singleShot(0, self._init_deferred)
 
     def filter_event(self, event):
         return any(
             self._managers_inst[ef].eventFilter(self, event)
             for ef in self.event_filters
+            if ef in self._managers_inst
         )
 
     def eventFilter(self, event_object, event):
         return any(
             self._managers_inst[ef].eventFilter(event_object, event)
             for ef in self.global_event_filters
+            if ef in self._managers_inst
         )
 
-    def _init_managers_instances(self):
-        for manager_name, manager_cls in self.managers.items():
+    def _init_deferred(self):
+        self._init_managers_batch(self.managers_deferred)
+
+    def _init_managers_batch(self, managers):
+        self._init_managers_instances(managers)
+        self._init_connections(managers)
+        self._init_event_filters()
+
+        self._init_managers(managers)
+
+    def _init_managers_instances(self, managers):
+        for manager_name, manager_path in managers.items():
+            manager_cls = _import_manager_cls(manager_path)
             manager = manager_cls(context=self._context, parent=self)
 
             self._managers_inst[manager_name] = manager
             self._register_commands(manager_name, manager)
 
-    def _init_managers(self):
-        for m in self._managers_inst.values():
-            m_init = getattr(m, "init", None)
+    def _init_managers(self, managers):
+        for manager_name in managers:
+            m_init = getattr(self._managers_inst[manager_name], "init", None)
             if m_init is None:
                 continue
 
             m_init()
 
     def _init_event_filters(self):
+        # Reinstalling a filter moves it to the front of the chain,
+        # so filters keep event_filters order whatever batch created them
         for ef in self.event_filters:
-            self.installEventFilter(self._managers_inst[ef])
+            if ef in self._managers_inst:
+                self.installEventFilter(self._managers_inst[ef])
 
-    def _init_connections(self):
+    def _init_connections(self, managers):
         for c_manager, c_list in self.connections.items():
             for c_sig, c_slot in c_list:
+                c_managers = {
+                    self._get_manager_name(c_manager, c_sig),
+                    self._get_manager_name(c_manager, c_slot),
+                } - {"s"}
+
+                if not self._is_connection_pending(c_managers, managers):
+                    continue
+
                 c_sig = self._get_manager_function(c_manager, c_sig)
                 c_slot = self._get_manager_function(c_manager, c_slot)
 
                 c_sig.connect(c_slot)
 
+    def _is_connection_pending(self, c_managers, managers):
+        is_ready = all(m in self._managers_inst for m in c_managers)
+        is_new = any(m in managers for m in c_managers)
+
+        return is_ready and is_new
+
+    def _get_manager_name(self, manager, signature):
+        if "." in signature:
+            return signature.split(".")[0]
+
+        return manager
+
     def _get_manager_function(self, manager, signature):
         if "." in signature:
             manager, function = signature.split(".")
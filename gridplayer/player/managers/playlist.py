@@ -6,7 +6,11 @@ from PyQt5.QtWidgets import QFileDialog, QMessageBox
 
 from gridplayer.dialogs.messagebox import QCustomMessageBox
 from gridplayer.models.grid_state import GridState
-from gridplayer.models.playlist import Playlist
+from gridplayer.models.playlist import (
+    Playlist,
+    excluded_fields_playlist,
+    excluded_fields_video,
+)
 from gridplayer.models.video import filter_video_uris
 from gridplayer.params.static import SeekSyncMode, WindowState
 from gridplayer.player.managers.base import ManagerBase
@@ -34,6 +38,7 @@ class PlaylistManager(ManagerBase):
         super().__init__(**kwargs)
 
         self._saved_playlist = None
+        self._is_track_changes = Settings().get("playlist/track_changes")
 
     @property
     def commands(self):
@@ -107,7 +112,7 @@ class PlaylistManager(ManagerBase):
 
         self._saved_playlist = {
             "path": file_path,
-            "state": hash(playlist.dumps()),
+            "state": self._get_playlist_state(),
         }
 
     def process_arguments(self, argv):
@@ -162,7 +167,7 @@ class PlaylistManager(ManagerBase):
 
         self._saved_playlist = {
             "path": playlist_file,
-            "state": hash(self._make_playlist().dumps()),
+            "state": self._get_playlist_state(),
         }
 
         self.playlist_file_loaded.emit(playlist_file)
@@ -190,8 +195,11 @@ class PlaylistManager(ManagerBase):
 
         return True
 
+    def set_track_changes(self, is_track_changes):
+        self._is_track_changes = is_track_changes
+
     def check_playlist_save(self) -> bool:
-        if not Settings().get("playlist/track_changes"):
+        if not self._is_track_changes:
             return True
 
         if not self._ctx.video_blocks:
@@ -220,8 +228,7 @@ class PlaylistManager(ManagerBase):
         if self._saved_playlist is None:
             return True
 
-        playlist_state = hash(self._make_playlist().dumps())
-        return playlist_state != self._saved_playlist["state"]
+        return self._get_playlist_state() != self._saved_playlist["state"]
 
     def _is_overwrite_denied(self, file_path: Path):
         if file_path.is_file():
@@ -240,17 +247,48 @@ class PlaylistManager(ManagerBase):
 
         return False
 
-    def _make_playlist(self):
+    def _get_playlist_state(self) -> int:
+        if "window_state" in excluded_fields_playlist():
+            window_state = None
+        else:
+            window_state = self._ctx.window_state
+
+        snapshots = {
+            s_id: snapshot.dict() for s_id, snapshot in self._ctx.snapshots.items()
+        }
+
+        playlist_state = (
+            self._ctx.grid_state.dict(),
+            window_state,
+            snapshots,
+            self._ctx.seek_sync_mode,
+            self._ctx.is_shuffle_on_load,
+            self._ctx.is_disable_click_pause,
+            self._ctx.is_disable_wheel_seek,
+            self._get_videos_state(),
+        )
+
+        return hash(_freeze(playlist_state))
+
+    def _get_videos_state(self):
+        video_exclude = excluded_fields_video()
+
+        return [
+            (str(v.uri), v.dict(exclude=video_exclude)) for v in self._playlist_videos()
+        ]
+
+    def _playlist_videos(self):
         # if shuffle on load is ON, keep videos in the same order to maintain save state
         if self._ctx.is_shuffle_on_load:
-            videos = sorted(self._ctx.video_blocks.videos, key=lambda v: str(v.uri))
-        else:
-            videos = self._ctx.video_blocks.videos
+            return sorted(self._ctx.video_blocks.videos, key=lambda v: str(v.uri))
 
+        return self._ctx.video_blocks.videos
+
+    def _make_playlist(self):
         return Playlist(
             grid_state=self._ctx.grid_state,
             window_state=self._ctx.window_state,
-            videos=videos,
+            videos=self._playlist_videos(),
             snapshots=self._ctx.snapshots,
             seek_sync_mode=self._ctx.seek_sync_mode,
             shuffle_on_load=self._ctx.is_shuffle_on_load,
@@ -268,3 +306,13 @@ def _emit_if_not_empty(*properties: Tuple[pyqtSignal, Any]):
 def _emit(*properties: Tuple[pyqtSignal, Any]):
     for signal, property_value in properties:
         signal.emit(property_value)
+
+
+def _freeze(state_value):
+    if isinstance(state_value, dict):
+        return _freeze(list(state_value.items()))
+
+    if isinstance(state_value, (list, tuple)):
+        return tuple(_freeze(v) for v in state_value)
+
+    return state_value
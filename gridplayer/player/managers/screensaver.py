@@ -9,14 +9,28 @@ class ScreensaverManager(ManagerBase):
 
         self.keepawake = KeepAwake()
 
+        self._is_inhibit_screensaver = Settings().get("player/inhibit_screensaver")
+        self._playing_videos_count = 0
+
+    def set_inhibit_screensaver(self, is_inhibit_screensaver):
+        self._is_inhibit_screensaver = bool(is_inhibit_screensaver)
+
+        self._update_screensaver()
+
     def screensaver_check(self, playing_videos_count):
-        if not Settings().get("player/inhibit_screensaver"):
-            self.keepawake.screensaver_on()
-            return
+        self._playing_videos_count = playing_videos_count
+
+        self._update_screensaver()
 
-        is_something_playing = playing_videos_count > 0
+    def _update_screensaver(self):
+        is_screensaver_off = (
+            self._is_inhibit_screensaver and self._playing_videos_count > 0
+        )
+
+        if is_screensaver_off == self.keepawake.is_screensaver_off:
+            return
 
-        if is_something_playing:
+        if is_screensaver_off:
             self.keepawake.screensaver_off()
         else:
             self.keepawake.screensaver_on()
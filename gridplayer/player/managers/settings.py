@@ -13,6 +13,7 @@ class SettingsManager(ManagerBase):
     set_log_level = pyqtSignal(int)
     set_log_level_vlc = pyqtSignal(int)
     set_recent_list_enabled = pyqtSignal(bool)
+    set_playlist_track_changes = pyqtSignal(bool)
 
     @property
     def commands(self):
@@ -44,6 +45,7 @@ class SettingsManager(ManagerBase):
             "logging/log_level_vlc": self.set_log_level_vlc,
             "player/inhibit_screensaver": self.set_screensaver,
             "player/recent_list_enabled": self.set_recent_list_enabled,
+            "playlist/track_changes": self.set_playlist_track_changes,
         }
 
         changes = self._setting_changes(previous_settings, tuple(checks))
@@ -3,27 +3,6 @@ from PyQt5.QtWidgets import QWidget
 
 from gridplayer.params import env
 from gridplayer.player.manager import ManagersManager
-from gridplayer.player.managers.actions import ActionsManager
-from gridplayer.player.managers.active_block import ActiveBlockManager
-from gridplayer.player.managers.add_videos import AddVideosManager
-from gridplayer.player.managers.dialogs import DialogsManager
-from gridplayer.player.managers.drag_n_drop import DragNDropManager
-from gridplayer.player.managers.grid import GridManager
-from gridplayer.player.managers.instance_listener import InstanceListenerManager
-from gridplayer.player.managers.log import LogManager
-from gridplayer.player.managers.macos_fileopen import MacOSFileOpenManager
-from gridplayer.player.managers.menu import MenuManager
-from gridplayer.player.managers.mouse_hide import MouseHideManager
-from gridplayer.player.managers.playlist import PlaylistManager
-from gridplayer.player.managers.recent_list import RecentListManager
-from gridplayer.player.managers.screensaver import ScreensaverManager
-from gridplayer.player.managers.settings import SettingsManager
-from gridplayer.player.managers.single_mode import SingleModeManager
-from gridplayer.player.managers.snapshots import SnapshotsManager
-from gridplayer.player.managers.stream_proxy import StreamProxyManager
-from gridplayer.player.managers.video_blocks import VideoBlocksManager
-from gridplayer.player.managers.video_driver import VideoDriverManager
-from gridplayer.player.managers.window_state import WindowStateManager
 
 
 class Player(QWidget, ManagersManager):
@@ -36,25 +15,55 @@ class Player(QWidget, ManagersManager):
         self.setAcceptDrops(True)
 
         self.managers = {
-            "video_driver": VideoDriverManager,
-            "window_state": WindowStateManager,
-            "video_blocks": VideoBlocksManager,
-            "grid": GridManager,
-            "playlist": PlaylistManager,
-            "snapshots": SnapshotsManager,
-            "screensaver": ScreensaverManager,
-            "active_block": ActiveBlockManager,
-            "mouse_hide": MouseHideManager,
-            "drag_n_drop": DragNDropManager,
-            "single_mode": SingleModeManager,
-            "log": LogManager,
-            "stream_proxy": StreamProxyManager,
-            "add_videos": AddVideosManager,
-            "recent_list": RecentListManager,
-            "dialogs": DialogsManager,
-            "settings": SettingsManager,
-            "actions": ActionsManager,
-            "menu": MenuManager,
+            "video_driver": (
+                "gridplayer.player.managers.video_driver",
+                "VideoDriverManager",
+            ),
+            "window_state": (
+                "gridplayer.player.managers.window_state",
+                "WindowStateManager",
+            ),
+            "video_blocks": (
+                "gridplayer.player.managers.video_blocks",
+                "VideoBlocksManager",
+            ),
+            "grid": ("gridplayer.player.managers.grid", "GridManager"),
+            "playlist": ("gridplayer.player.managers.playlist", "PlaylistManager"),
+            "snapshots": ("gridplayer.player.managers.snapshots", "SnapshotsManager"),
+            "active_block": (
+                "gridplayer.player.managers.active_block",
+                "ActiveBlockManager",
+            ),
+            "single_mode": (
+                "gridplayer.player.managers.single_mode",
+                "SingleModeManager",
+            ),
+            "stream_proxy": (
+                "gridplayer.player.managers.stream_proxy",
+                "StreamProxyManager",
+            ),
+        }
+
+        self.managers_deferred = {
+            "screensaver": (
+                "gridplayer.player.managers.screensaver",
+                "ScreensaverManager",
+            ),
+            "mouse_hide": ("gridplayer.player.managers.mouse_hide", "MouseHideManager"),
+            "drag_n_drop": (
+                "gridplayer.player.managers.drag_n_drop",
+                "DragNDropManager",
+            ),
+            "log": ("gridplayer.player.managers.log", "LogManager"),
+            "add_videos": ("gridplayer.player.managers.add_videos", "AddVideosManager"),
+            "recent_list": (
+                "gridplayer.player.managers.recent_list",
+                "RecentListManager",
+            ),
+            "dialogs": ("gridplayer.player.managers.dialogs", "DialogsManager"),
+            "settings": ("gridplayer.player.managers.settings", "SettingsManager"),
+            "actions": ("gridplayer.player.managers.actions", "ActionsManager"),
+            "menu": ("gridplayer.player.managers.menu", "MenuManager"),
         }
 
         self.connections = {
@@ -91,11 +100,12 @@ class Player(QWidget, ManagersManager):
             ],
             "settings": [
                 ("reload", "video_blocks.reload_videos"),
-                ("set_screensaver", "screensaver.screensaver_check"),
+                ("set_screensaver", "screensaver.set_inhibit_screensaver"),
                 ("set_log_level", "log.set_log_level"),
                 ("set_log_level", "video_driver.set_log_level"),
                 ("set_log_level_vlc", "video_driver.set_log_level_vlc"),
                 ("set_recent_list_enabled", "recent_list.set_recent_list_state"),
+                ("set_playlist_track_changes", "playlist.set_track_changes"),
             ],
             "playlist": [
                 ("s.arguments_received", "process_arguments"),
@@ -132,13 +142,23 @@ class Player(QWidget, ManagersManager):
         }
 
         if env.IS_MACOS:
-            self.managers["macos_fileopen"] = MacOSFileOpenManager
+            self.managers["macos_fileopen"] = (
+                "gridplayer.player.managers.macos_fileopen",
+                "MacOSFileOpenManager",
+            )
             self.connections["macos_fileopen"] = [
                 ("file_opened", "playlist.process_arguments")
             ]
             self.global_event_filters.append("macos_fileopen")
+
+            # Files can be opened before deferred managers are created
+            for manager_name in ("dialogs", "recent_list"):
+                self.managers[manager_name] = self.managers_deferred.pop(manager_name)
         else:
-            self.managers["instance_listener"] = InstanceListenerManager
+            self.managers_deferred["instance_listener"] = (
+                "gridplayer.player.managers.instance_listener",
+                "InstanceListenerManager",
+            )
             self.connections["instance_listener"] = [
                 ("files_opened", "playlist.process_arguments"),
                 ("window_state.closing", "cleanup"),
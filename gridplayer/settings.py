@@ -130,8 +130,15 @@ class _Settings(object):
     def reset(self, setting_name):
         self.set(setting_name, _default_settings[setting_name])
 
+    def get_many(self, settings):  # noqa: WPS615
+        return {k: self.get(k) for k in settings}
+
+    def set_many(self, settings_values):  # noqa: WPS615
+        for setting_name, setting_value in settings_values.items():
+            self.set(setting_name, setting_value)
+
     def get_all(self):
-        return {k: self.get(k) for k in _default_settings}
+        return self.get_many(_default_settings)
 
     def sync(self):
         self.settings.sync()
@@ -12,15 +12,18 @@ def excepthook(exc_type, exc_value, exc_tb):
         logging.info("KeyboardInterrupt")
         force_terminate()
 
-    # Log into file
-    exception_txt = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+    logger = logging.getLogger("UNHANDLED")
 
-    logging.getLogger("UNHANDLED").critical(exception_txt)
-
-    # Terminate if Qt is not up
+    # Terminate if Qt is not up, let logging format the traceback
     if QApplication.instance() is None:
+        logger.critical("Unhandled exception", exc_info=(exc_type, exc_value, exc_tb))
         force_terminate(1)
 
+    # Log into file
+    exception_txt = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
+
+    logger.critical(exception_txt)
+
     for w in QApplication.topLevelWidgets():
         w.hide()
     QApplication.restoreOverrideCursor()
@@ -1,10 +1,13 @@
-import time
+from functools import lru_cache
 from typing import Optional
 
 HOUR_SECONDS = 3600
 DAY_SECONDS = HOUR_SECONDS * 24
 
+TIME_TXT_CACHE_SIZE = 4096
 
+
+@lru_cache(maxsize=TIME_TXT_CACHE_SIZE)
 def get_time_txt(
     seconds: int, max_seconds: Optional[int] = None, strip: bool = False
 ) -> str:
@@ -30,9 +33,13 @@ def get_time_txt(
 
 
 def _fmt_time(seconds, seconds_cnt):
+    hours, minutes_cnt = divmod(int(seconds) % DAY_SECONDS, HOUR_SECONDS)
+    minutes, clock_seconds = divmod(minutes_cnt, 60)
+    minutes_txt = f"{minutes:02d}:{clock_seconds:02d}"
+
     if seconds_cnt >= HOUR_SECONDS:
-        return time.strftime("%H:%M:%S", time.gmtime(seconds))
+        return f"{hours:02d}:{minutes_txt}"
     elif seconds_cnt >= 60:
-        return time.strftime("%M:%S", time.gmtime(seconds))
+        return minutes_txt
 
-    return time.strftime("0:%S", time.gmtime(seconds))
+    return f"0:{clock_seconds:02d}"
@@ -1,9 +1,28 @@
 import contextlib
 import logging
 
-from gridplayer.multiprocess.safe_shared_memory import releasing
 from gridplayer.vlc_player.libvlc import vlc
 
+# Bytes of the frame compared to detect a new picture while paused
+FRAME_HEAD_SIZE = 1024
+
+# Decoders by the opaque pointer that VLC passes to video callbacks
+_decoders = {}
+
+
+@vlc.CallbackDecorators.VideoLockCb
+def _libvlc_lock_callback(opaque, planes):
+    _decoders[opaque].lock_frame(planes)
+
+
+@vlc.CallbackDecorators.VideoUnlockCb
+def _libvlc_unlock_callback(opaque, picta, planes):
+    decoder = _decoders.get(opaque)
+
+    # decoder could be stopped mid-frame, it releases the lock itself then
+    if decoder is not None:
+        decoder.unlock_frame()
+
 
 class ImageDecoder(object):
     def __init__(self, shared_memory, frame_ready_cb=None):
@@ -13,8 +32,7 @@ class ImageDecoder(object):
 
         self.is_paused = True
 
-        self.lock_cb = self.libvlc_lock_callback()
-        self.unlock_cb = self.libvlc_unlock_callback()
+        self._opaque = id(self)
 
         self._stopped = False
 
@@ -22,10 +40,17 @@ class ImageDecoder(object):
         self._width = None
         self._height = None
 
+        self._buffer_size = None
+        self._buffer_ptrs = None
+        self._frame_heads = None
+        self._write_seq = 1
+        self._write_idx = 1
+
         self._shared_memory = shared_memory
         self._frame_ready_cb = frame_ready_cb
 
-        self._prev_frame_head = None
+        # empty until the first paused frame, never equal to a frame head
+        self._prev_frame_head = bytearray()
 
     def set_frame(self, width, height):
         self._log.debug(f"Allocating shared memory for {width}x{height} frame")
@@ -35,37 +60,54 @@ class ImageDecoder(object):
 
         self._row_size = self._width * 4
 
-        buf_size = self._height * self._row_size
+        self._buffer_size = self._height * self._row_size
+
+        self._shared_memory.allocate(self._buffer_size)
+
+        buffer_starts = [
+            idx * self._buffer_size for idx in range(len(self._shared_memory.locks))
+        ]
 
-        self._shared_memory.allocate(buf_size)
+        base_ptr = self._shared_memory.ptr.value
+        self._buffer_ptrs = tuple(base_ptr + start for start in buffer_starts)
+
+        frame_buf = self._shared_memory.memory.buf
+        self._frame_heads = tuple(
+            frame_buf[start : start + FRAME_HEAD_SIZE] for start in buffer_starts
+        )
 
     def attach_media_player(self, media_player):
-        media_player.video_set_callbacks(self.lock_cb, self.unlock_cb, None, None)
-        media_player.video_set_format("RV32", self._width, self._height, self._row_size)
+        _decoders[self._opaque] = self
 
-    def libvlc_lock_callback(self):
-        @vlc.CallbackDecorators.VideoLockCb
-        def _cb(opaque, planes):  # noqa: WPS430
-            self._shared_memory.lock.acquire()
-            planes[0] = self._shared_memory.ptr
+        media_player.video_set_callbacks(
+            _libvlc_lock_callback, _libvlc_unlock_callback, None, self._opaque
+        )
+        media_player.video_set_format("RV32", self._width, self._height, self._row_size)
 
-        return _cb
+    def detach_media_player(self):
+        # the lock callback must hand VLC a buffer, so unregister
+        # only once the media player is released
+        _decoders.pop(self._opaque, None)
 
-    def libvlc_unlock_callback(self):
-        @vlc.CallbackDecorators.VideoUnlockCb
-        def _cb(opaque, picta, planes):  # noqa: WPS430
-            with releasing(self._shared_memory.lock):
-                if self._stopped:
-                    return
+    def lock_frame(self, planes):
+        # write to the buffer that is not displayed
+        self._write_seq = self._shared_memory.frame_seq.value + 1
+        self._write_idx = self._write_seq % len(self._buffer_ptrs)
+        self._shared_memory.locks[self._write_idx].acquire()
+        planes[0] = self._buffer_ptrs[self._write_idx]
 
-                # Callback is firing while on pause,
-                # so check if the frame content actually changed
-                if self.is_paused and not self._is_frame_changed():
-                    return
+    def unlock_frame(self):
+        buffer_lock = self._shared_memory.locks[self._write_idx]
 
-                self._frame_ready_cb()
+        try:  # noqa: WPS501
+            is_published = self._publish_frame()
+        finally:
+            # stop() releases the lock itself when it comes mid-frame
+            if not self._stopped:
+                buffer_lock.release()
 
-        return _cb
+        if is_published:
+            self._frame_ready_cb()
 
     def stop(self):
         self._log.debug("Stopping image decoder")
@@ -74,16 +116,29 @@ class ImageDecoder(object):
 
         # make sure that memory lock released in case it was locked mid-callback
         with contextlib.suppress(ValueError):
-            self._shared_memory.lock.release()
+            self._shared_memory.locks[self._write_idx].release()
+
+        # views must be gone before the memory can be closed
+        self._frame_heads = None
 
         with self._shared_memory:
             self._shared_memory.close()
 
-    def _is_frame_changed(self):
-        new_frame_head = bytes(self._shared_memory.memory.buf[:1024])
-
-        if new_frame_head == self._prev_frame_head:
+    def _publish_frame(self):
+        if self._stopped:
             return False
 
-        self._prev_frame_head = new_frame_head
+        # Callback is firing while on pause,
+        # so check if the frame content actually changed
+        if self.is_paused:
+            frame_head = self._frame_heads[self._write_idx]
+
+            if frame_head == self._prev_frame_head:
+                return False
+
+            # copy in place, no new bytes object per callback
+            self._prev_frame_head[:] = frame_head  # noqa: WPS362
+
+        self._shared_memory.frame_seq.value = self._write_seq
+
         return True
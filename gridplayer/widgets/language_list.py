@@ -1,3 +1,6 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 from PyQt5.QtCore import QSize, Qt
 from PyQt5.QtGui import QPalette
 from PyQt5.QtSvg import QSvgWidget
@@ -10,10 +13,42 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from gridplayer.params.languages import Language
+from gridplayer.params.languages import LANGUAGES, Language
 from gridplayer.widgets.video_status import StatusIcon
 
 
+def _make_language_title(language: Language):
+    if language.completion == 100:
+        completion_txt = ""
+    else:
+        completion_txt = f" [{language.completion} %]"
+
+    if language.authors:
+        return (
+            "<p style='margin-bottom: 5px;'>"
+            "<b>{language}</b> ({country}){completion_txt}</p>"
+            "<p style='margin: 0;'>Author: {author}</p>".format(
+                language=language.title_native,
+                country=language.country_native,
+                completion_txt=completion_txt,
+                author=", ".join(language.author_links),
+            )
+        )
+
+    return "<p><b>{language}</b> ({country}){completion_txt}</p>".format(
+        language=language.title_native,
+        country=language.country_native,
+        completion_txt=completion_txt,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_language_titles():
+    return MappingProxyType(
+        {language.code: _make_language_title(language) for language in LANGUAGES}
+    )
+
+
 class LanguageRowWidget(QWidget):
     flag_size = QSize(48, 36)  # noqa: WPS432
     font_size = 14
@@ -82,28 +117,9 @@ class LanguageList(QListWidget):
         self.currentItemChanged.connect(self._set_language_checkmark)
 
     def add_language_row(self, language: Language):
-        if language.completion == 100:
-            completion_txt = ""
-        else:
-            completion_txt = f" [{language.completion} %]"
-
-        if language.authors:
-            item_title = (
-                "<p style='margin-bottom: 5px;'>"
-                "<b>{language}</b> ({country}){completion_txt}</p>"
-                "<p style='margin: 0;'>Author: {author}</p>".format(
-                    language=language.title_native,
-                    country=language.country_native,
-                    completion_txt=completion_txt,
-                    author=", ".join(language.author_links),
-                )
-            )
-        else:
-            item_title = "<p><b>{language}</b> ({country}){completion_txt}</p>".format(
-                language=language.title_native,
-                country=language.country_native,
-                completion_txt=completion_txt,
-            )
+        item_title = _get_language_titles().get(language.code)
+        if item_title is None:
+            item_title = _make_language_title(language)
 
         row_item_w = LanguageRowWidget(item_title, language.icon_path)
 
@@ -1,10 +1,12 @@
+import threading
+from collections import deque
 from multiprocessing import Array, Lock, Value
 
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QBrush, QImage, QPainter, QPixmap
 from PyQt5.QtWidgets import QFrame, QGraphicsPixmapItem, QGraphicsScene, QGraphicsView
 
-from gridplayer.multiprocess.safe_shared_memory import SafeSharedMemory
+from gridplayer.multiprocess.safe_shared_memory import SafeSharedMemory, releasing
 from gridplayer.params.static import PLAYER_ID_LENGTH, VideoCrop
 from gridplayer.utils.qt import QT_ASPECT_MAP, qt_connect
 from gridplayer.vlc_player.image_decoder import ImageDecoder
@@ -21,22 +23,45 @@ class InstanceProcessVLCSW(InstanceProcessVLC):
         # shared data multiprocess
         self._memory_locks = [
             {
-                "lock": Lock(),
+                # double buffered frame, the decoder writes to one buffer
+                # while the other one is displayed
+                "locks": (Lock(), Lock()),
+                "frame_seq": Value("Q", 0, lock=False),
                 "is_busy": Value("i", 0),
                 "player_id": Array("c", PLAYER_ID_LENGTH * 2),
             }
             for _ in range(self.players_per_instance)
         ]
 
+        # per-process index, filled on first lookup
+        self._player_lock_by_id = {}
+
+        # slots known to be free outside, refilled when exhausted
+        self._free_slots = deque(range(self.players_per_instance))
+
         self._vlc.vlc_options.append("--vout=vdummy")
 
     def init_player_shared_data(self, player_id):
-        available_locks = (ml for ml in self._memory_locks if ml["is_busy"].value == 0)
+        if not self._free_slots:
+            # slots are released by the process, pick them up here
+            self._free_slots.extend(
+                slot
+                for slot, ml in enumerate(self._memory_locks)
+                if ml["is_busy"].value == 0
+            )
 
-        player_lock = next(available_locks)
+        if not self._free_slots:
+            raise RuntimeError(
+                f"No free shared memory slot, limit is {self.players_per_instance}"
+            )
+
+        player_lock = self._memory_locks[self._free_slots.popleft()]
 
         player_lock["is_busy"].value = 1
         player_lock["player_id"].value = player_id.encode()
+        player_lock["frame_seq"].value = 0
+
+        self._player_lock_by_id[player_id] = player_lock
 
         self._players_shared_data[player_id] = self.get_player_shared_memory(player_id)
 
@@ -46,16 +71,33 @@ class InstanceProcessVLCSW(InstanceProcessVLC):
         player_lock["player_id"].value = b""
         player_lock["is_busy"].value = 0
 
+        self._player_lock_by_id.pop(player_id)
+
+    def cleanup_player_shared_data(self, player_id):
+        super().cleanup_player_shared_data(player_id)
+
+        self._player_lock_by_id.pop(player_id, None)
+
     def get_player_lock(self, player_id):
-        return next(
-            ml
-            for ml in self._memory_locks
-            if ml["player_id"].value == player_id.encode()
-        )
+        player_lock = self._player_lock_by_id.get(player_id)
+
+        # slot is assigned outside, so the process has to find it once
+        if player_lock is None:
+            player_id_encoded = player_id.encode()
+            player_lock = next(
+                ml
+                for ml in self._memory_locks
+                if ml["player_id"].value == player_id_encoded
+            )
+            self._player_lock_by_id[player_id] = player_lock
+
+        return player_lock
 
     def get_player_shared_memory(self, player_id):
         player_lock = self.get_player_lock(player_id)
-        return SafeSharedMemory(player_id, player_lock["lock"])
+        return SafeSharedMemory(
+            player_id, player_lock["locks"], player_lock["frame_seq"]
+        )
 
     def new_player(self, player_id, init_data, pipe):
         init_data["shared_memory"] = self.get_player_shared_memory(player_id)
@@ -102,6 +144,8 @@ class PlayerProcessSingleVLCSW(VlcPlayerThreaded):
     def cleanup(self):
         super().cleanup()
 
+        # media player is released, no video callbacks can come anymore
+        self.decoder.detach_media_player()
         self.decoder.stop()
 
         self.release_callback(self.id)
@@ -161,6 +205,8 @@ class VideoDriverVLCSW(VLCVideoDriverThreaded):
     set_dummy_frame_sig = pyqtSignal()
     image_ready_sig = pyqtSignal()
 
+    frame_restored = pyqtSignal()
+
     def __init__(self, image_dest, process_manager, vlc_options, **kwargs):
         super().__init__(**kwargs)
 
@@ -170,7 +216,15 @@ class VideoDriverVLCSW(VLCVideoDriverThreaded):
         self._image_dest = image_dest
         self._shared_memory = None
 
-        self._pix = None
+        self._frames = None
+        self._frame_seq = 0
+
+        self._is_visible = True
+
+        # only the latest frame is shown when GUI falls behind
+        self._pending_pix = None
+        self._paint_scheduled = False
+        self._pending_lock = threading.Lock()
 
         qt_connect(
             (self.set_dummy_frame_sig, self.set_dummy_frame),
@@ -187,6 +241,21 @@ class VideoDriverVLCSW(VLCVideoDriverThreaded):
         self._width = width
         self._height = height
 
+        # QImage views over the shared buffers, reused for every frame
+        # RV32 rows are not padded, same as the decoder pitch
+        bytes_per_line = width * 4
+        buffer_size = bytes_per_line * height
+        self._frames = tuple(
+            QImage(
+                self._shared_memory.memory.buf[idx * buffer_size :],
+                width,
+                height,
+                bytes_per_line,
+                QImage.Format_RGB32,
+            )
+            for idx in range(len(self._shared_memory.locks))
+        )
+
         self.set_dummy_frame_sig.emit()
 
     def set_dummy_frame(self):
@@ -195,32 +264,76 @@ class VideoDriverVLCSW(VLCVideoDriverThreaded):
         self._image_dest.setPixmap(pix)
 
     def process_image(self):
-        if self._shared_memory is None:
+        shared_memory = self._shared_memory
+
+        if shared_memory is None or not self._is_visible:
             return
 
-        try:
-            with self._shared_memory:
-                px = QImage(
-                    self._shared_memory.memory.buf,
-                    self._width,
-                    self._height,
-                    QImage.Format_RGB32,
-                )
-        except AttributeError:
-            # Very rare race condition
-            self._log.warning("Shared memory is cleared already")
+        frame_seq = shared_memory.frame_seq.value
+
+        # frame was already shown by an earlier request
+        if frame_seq == self._frame_seq:
+            return
+
+        self._frame_seq = frame_seq
+
+        buffer_idx = frame_seq % len(shared_memory.locks)
+        buffer_lock = shared_memory.locks[buffer_idx]
+
+        # decoder is already writing a newer frame into this buffer
+        # and will request it once done, so don't wait for it
+        if not buffer_lock.acquire(block=False):
             return
 
-        self._pix = QPixmap.fromImage(px)
+        with releasing(buffer_lock):
+            if self._frames is None:
+                # Very rare race condition
+                self._log.warning("Shared memory is cleared already")
+                return
 
-        self.image_ready_sig.emit()
+            pix = QPixmap.fromImage(self._frames[buffer_idx], Qt.NoFormatConversion)
+
+        self._schedule_paint(pix)
 
     def image_ready(self):
-        self._image_dest.setPixmap(self._pix)
+        # a frame arriving after the handoff schedules another paint
+        with self._pending_lock:
+            pix = self._pending_pix
+            self._pending_pix = None
+            self._paint_scheduled = False
+
+        # frame could be hidden while the paint was queued
+        if pix is None or not self._is_visible:
+            return
+
+        is_restored = self._image_dest.pixmap().isNull()
+        self._image_dest.setPixmap(pix)
+
+        if is_restored:
+            self.frame_restored.emit()
+
+    def set_visible(self, is_visible):
+        self._is_visible = is_visible
+
+        if is_visible:
+            # frames are skipped while hidden, catch up with the latest one
+            self.cmd_send_self("process_image")
+        else:
+            # don't hold full size frames for a hidden video
+            self._image_dest.setPixmap(QPixmap())
+            self.cmd_send_self("release_pixmaps")
+
+    def release_pixmaps(self):
+        # redraw the latest frame once visible again
+        self._frame_seq = 0
+
+        with self._pending_lock:
+            self._pending_pix = None
 
     def cleanup(self):
         if self._shared_memory is not None:
             with self._shared_memory:
+                self._frames = None
                 self._shared_memory.close()
                 self._shared_memory = None
 
@@ -228,6 +341,16 @@ class VideoDriverVLCSW(VLCVideoDriverThreaded):
 
         self.player.cleanup()
 
+    def _schedule_paint(self, pix):
+        with self._pending_lock:
+            self._pending_pix = pix
+
+            is_scheduled = self._paint_scheduled
+            self._paint_scheduled = True
+
+        if not is_scheduled:
+            self.image_ready_sig.emit()
+
 
 class VideoFrameVLCSW(VideoFrameVLCProcess):
     is_opengl = False
@@ -240,6 +363,12 @@ class VideoFrameVLCSW(VideoFrameVLCProcess):
             parent=self,
         )
 
+    def driver_connect(self) -> None:
+        super().driver_connect()
+
+        # pixmap size defines the view, so it has to be fitted again
+        qt_connect((self.video_driver.frame_restored, self.adjust_view))
+
     def ui_video_surface(self):  # noqa: WPS213
         self._videoitem = QGraphicsPixmapItem()
         self._videoitem.setTransformationMode(Qt.SmoothTransformation)
@@ -256,12 +385,7 @@ class VideoFrameVLCSW(VideoFrameVLCProcess):
         video_surface.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         video_surface.setFrameStyle(QFrame.NoFrame)
         video_surface.setLineWidth(0)
-        video_surface.setRenderHints(
-            QPainter.Antialiasing
-            | QPainter.SmoothPixmapTransform
-            | QPainter.TextAntialiasing
-            | QPainter.HighQualityAntialiasing
-        )
+        video_surface.setRenderHints(QPainter.SmoothPixmapTransform)
 
         return video_surface
 
@@ -280,6 +404,27 @@ class VideoFrameVLCSW(VideoFrameVLCProcess):
 
         self.video_driver.cleanup()
 
+    def playback_status_changed_emit(self, is_paused) -> None:
+        # smooth scaling only for still frames, it is too costly on playback
+        if is_paused:
+            self._videoitem.setTransformationMode(Qt.SmoothTransformation)
+        else:
+            self._videoitem.setTransformationMode(Qt.FastTransformation)
+
+        super().playback_status_changed_emit(is_paused)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+
+        if not self._is_cleanup_requested:
+            self.video_driver.set_visible(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+
+        if not self._is_cleanup_requested:
+            self.video_driver.set_visible(False)
+
     def take_snapshot(self) -> None:
         # no need to take snapshot, last frame stays in QGraphicsView on stop
         self.video_driver.set_pause(True)
@@ -23,6 +23,8 @@ SRC_DIR = os.path.abspath("./{APP_MODULE}")
 BUILD_DIR = os.path.abspath("./build")
 
 hiddenimports = collect_submodules('streamlink.plugins')
+# Player managers are imported by name on demand
+hiddenimports += collect_submodules('gridplayer.player.managers')
 
 excludes = [
     "PyQt5.QtBluetooth",
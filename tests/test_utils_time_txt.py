@@ -29,6 +29,8 @@ def test_get_time_txt(time_int, time_str):
         (0, 60, "00:00"),
         (0, 3600, "00:00:00"),
         (0, 86400, "00:00:00"),
+        (61, 3600, "00:01:01"),
+        (3661, 86400, "01:01:01"),
     ],
 )
 def test_get_time_txt_maxtime(time_int, max_time_int, time_str):